@@ -1,17 +1,24 @@
-from modules.fuzzy_logic import compute_fuzzy_performance
-from modules.feedback import generate_feedback
+from modules.evaluation import evaluate_student
 from modules.report import generate_pdf
 from modules.chatbot import chatbot_response
 
+# Give input() line editing and history in the chatbot loop (readline is
+# not available on every platform)
+try:
+    import readline
+except ImportError:
+    pass
+
 # Get inputs
 attendance = float(input("Enter your attendance percentage (0-100): "))
 test = float(input("Enter your test score (0-100): "))
 assignment = float(input("Enter your assignment score (0-100): "))
 
 # Fuzzy logic evaluation
-score, category = compute_fuzzy_performance(attendance, test, assignment)
-
-feedback = generate_feedback(attendance, test, assignment)
+result = evaluate_student(attendance, test, assignment)
+score = result["score"]
+category = result["category"]
+feedback = result["feedback"]
 
 print("\n=== Student Performance (Fuzzy Logic) ===")
 print("Fuzzy Score:", round(score, 2))
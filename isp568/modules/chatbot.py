@@ -1,11 +1,31 @@
-def chatbot_response(message):
-    message = message.lower()
-
-    if "tips" in message:
-        return "Study consistently and revise weekly!"
-    if "attendance" in message:
-        return "Attendance helps you understand lessons better."
-    if "improve" in message:
-        return "Focus on weak areas and ask teachers for help."
-
-    return "I'm here to help with your performance questions!"
+import re
+from functools import lru_cache
+
+# Keyword -> reply table; earlier entries win when a message mentions
+# several keywords
+_RESPONSES = {
+    "tips": "Study consistently and revise weekly!",
+    "attendance": "Attendance helps you understand lessons better.",
+    "improve": "Focus on weak areas and ask teachers for help.",
+}
+
+_DEFAULT_RESPONSE = "I'm here to help with your performance questions!"
+
+# One compiled alternation finds every keyword in a single scan of the
+# message instead of one substring search per keyword
+_KEYWORD_RE = re.compile("|".join(map(re.escape, _RESPONSES)))
+
+# Chat messages repeat a lot in practice, so memoize the lookup on the
+# lowercased message
+@lru_cache(maxsize=256)
+def _lookup_response(message):
+    found = set(_KEYWORD_RE.findall(message))
+
+    for keyword, response in _RESPONSES.items():
+        if keyword in found:
+            return response
+
+    return _DEFAULT_RESPONSE
+
+def chatbot_response(message):
+    return _lookup_response(message.lower())
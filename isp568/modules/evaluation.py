@@ -1,12 +1,49 @@
+from bisect import bisect_right
+
+from modules.fuzzy_logic import (
+    compute_fuzzy_performance,
+    compute_fuzzy_performance_batch,
+)
+from modules.feedback import generate_feedback
+
+def evaluate_students(records):
+    # Batch version of evaluate_student: records is a list of dicts with
+    # attendance/test/assignment keys, scored in one vectorized pass
+    scores, categories = compute_fuzzy_performance_batch(
+        [r["attendance"] for r in records],
+        [r["test"] for r in records],
+        [r["assignment"] for r in records],
+    )
+
+    return [
+        {
+            "score": score,
+            "category": category,
+            "feedback": generate_feedback(
+                r["attendance"], r["test"], r["assignment"]
+            ),
+        }
+        for r, score, category in zip(records, scores, categories)
+    ]
+
+def evaluate_student(attendance, test, assignment):
+    score, category = compute_fuzzy_performance(attendance, test, assignment)
+    feedback = generate_feedback(attendance, test, assignment)
+
+    return {
+        "score": score,
+        "category": category,
+        "feedback": feedback,
+    }
+
+# Category boundaries (inclusive) and their labels, indexed by how many
+# boundaries the score has reached
+_CAT_BOUNDS = (50, 65, 80)
+_CATEGORIES = ("Poor", "Average", "Good", "Excellent")
+
 def calculate_total(attendance, test, assignment):
     return (attendance * 0.2) + (test * 0.5) + (assignment * 0.3)
 
 def get_category(score):
-    if score >= 80:
-        return "Excellent"
-    elif score >= 65:
-        return "Good"
-    elif score >= 50:
-        return "Average"
-    else:
-        return "Poor"
+    # bisect_right keeps the original >= semantics at each boundary
+    return _CATEGORIES[bisect_right(_CAT_BOUNDS, score)]
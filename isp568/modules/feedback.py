@@ -1,18 +1,24 @@
-def generate_feedback(attendance, test, assignment):
-    tips = []
-
-    if test >= 80:
-        tips.append("Great job in test performance!")
-
-    if attendance < 70:
-        tips.append("Try to attend more classes.")
-
-    if test < 50:
-        tips.append("You need to improve your test understanding.")
-
-    if assignment < 15:
-        tips.append("Assignments need more effort.")
-
-    tips.append("Keep practicing and don't give up!")
-
-    return tips
+from operator import ge, lt
+
+# Feedback rules as (metric, comparison, threshold, tip), evaluated in
+# order so the tip order matches the old branch chain
+_FEEDBACK_RULES = (
+    ("test", ge, 80, "Great job in test performance!"),
+    ("attendance", lt, 70, "Try to attend more classes."),
+    ("test", lt, 50, "You need to improve your test understanding."),
+    ("assignment", lt, 15, "Assignments need more effort."),
+)
+
+_CLOSING_TIP = "Keep practicing and don't give up!"
+
+def generate_feedback(attendance, test, assignment):
+    scores = {"attendance": attendance, "test": test, "assignment": assignment}
+
+    tips = [
+        tip
+        for metric, compare, threshold, tip in _FEEDBACK_RULES
+        if compare(scores[metric], threshold)
+    ]
+    tips.append(_CLOSING_TIP)
+
+    return tips
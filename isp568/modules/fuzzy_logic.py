@@ -1,52 +1,101 @@
-import numpy as np
-import skfuzzy as fuzz
-
-def compute_fuzzy_performance(attendance, test, assignment):
-
-    # Define fuzzy ranges 0–100 scale
-    x = np.arange(0, 101, 1)
-
-    # Membership functions
-    attendance_low = fuzz.trimf(x, [0, 0, 50])
-    attendance_med = fuzz.trimf(x, [40, 60, 80])
-    attendance_high = fuzz.trimf(x, [70, 100, 100])
-
-    test_low = fuzz.trimf(x, [0, 0, 50])
-    test_med = fuzz.trimf(x, [40, 60, 80])
-    test_high = fuzz.trimf(x, [70, 100, 100])
-
-    assignment_low = fuzz.trimf(x, [0, 0, 60])
-    assignment_med = fuzz.trimf(x, [50, 70, 85])
-    assignment_high = fuzz.trimf(x, [75, 100, 100])
-
-    # Fuzzy membership strength
-    att_low = fuzz.interp_membership(x, attendance_low, attendance)
-    att_med = fuzz.interp_membership(x, attendance_med, attendance)
-    att_high = fuzz.interp_membership(x, attendance_high, attendance)
-
-    test_low_m = fuzz.interp_membership(x, test_low, test)
-    test_med_m = fuzz.interp_membership(x, test_med, test)
-    test_high_m = fuzz.interp_membership(x, test_high, test)
-
-    ass_low = fuzz.interp_membership(x, assignment_low, assignment)
-    ass_med = fuzz.interp_membership(x, assignment_med, assignment)
-    ass_high = fuzz.interp_membership(x, assignment_high, assignment)
-
-    # Rule-based evaluation (simple fuzzy rules)
-    performance_score = (
-        att_high * 0.3 + test_high_m * 0.4 + ass_high * 0.3 +
-        att_med * 0.2 + test_med_m * 0.3 + ass_med * 0.2 +
-        att_low * 0.1 + test_low_m * 0.1 + ass_low * 0.1
-    ) * 100
-
-    # Final fuzzy result
-    if performance_score > 75:
-        category = "Excellent"
-    elif performance_score > 60:
-        category = "Good"
-    elif performance_score > 45:
-        category = "Average"
-    else:
-        category = "Poor"
-
-    return performance_score, category
+from bisect import bisect_left
+
+import numpy as np
+
+# Define fuzzy ranges 0–100 scale (shared by every membership function)
+_X = np.arange(0, 101, 1)
+
+def _trimf(x, abc):
+    # Branchless triangular membership: rising and falling edges clipped
+    # to [0, 1]; a flat edge (a == b or b == c) is a shoulder at 1
+    a, b, c = abc
+    left = np.ones(len(x)) if b == a else np.clip((x - a) / (b - a), 0.0, 1.0)
+    right = np.ones(len(x)) if c == b else np.clip((c - x) / (c - b), 0.0, 1.0)
+    return left * right
+
+# Membership functions (fixed parameters, built once at import so each
+# call is just a lookup instead of rebuilding nine arrays)
+_ATT_LOW = _trimf(_X, [0, 0, 50])
+_ATT_MED = _trimf(_X, [40, 60, 80])
+_ATT_HIGH = _trimf(_X, [70, 100, 100])
+
+_TEST_LOW = _trimf(_X, [0, 0, 50])
+_TEST_MED = _trimf(_X, [40, 60, 80])
+_TEST_HIGH = _trimf(_X, [70, 100, 100])
+
+_ASS_LOW = _trimf(_X, [0, 0, 60])
+_ASS_MED = _trimf(_X, [50, 70, 85])
+_ASS_HIGH = _trimf(_X, [75, 100, 100])
+
+# Category boundaries (exclusive) and their labels, indexed by how many
+# boundaries the score exceeds
+_CAT_BOUNDS = (45, 60, 75)
+_CATEGORIES = ("Poor", "Average", "Good", "Excellent")
+
+def membership_curves():
+    # Precomputed membership tables keyed by input and term, for plotting
+    return {
+        "Attendance": {"Low": _ATT_LOW, "Medium": _ATT_MED, "High": _ATT_HIGH},
+        "Test": {"Low": _TEST_LOW, "Medium": _TEST_MED, "High": _TEST_HIGH},
+        "Assignment": {"Low": _ASS_LOW, "Medium": _ASS_MED, "High": _ASS_HIGH},
+    }
+
+def compute_fuzzy_performance(attendance, test, assignment):
+
+    # Fuzzy membership strength: interpolated lookup into the precomputed
+    # tables (exact at the integer grid points, linear in between)
+    att_low = np.interp(attendance, _X, _ATT_LOW)
+    att_med = np.interp(attendance, _X, _ATT_MED)
+    att_high = np.interp(attendance, _X, _ATT_HIGH)
+
+    test_low_m = np.interp(test, _X, _TEST_LOW)
+    test_med_m = np.interp(test, _X, _TEST_MED)
+    test_high_m = np.interp(test, _X, _TEST_HIGH)
+
+    ass_low = np.interp(assignment, _X, _ASS_LOW)
+    ass_med = np.interp(assignment, _X, _ASS_MED)
+    ass_high = np.interp(assignment, _X, _ASS_HIGH)
+
+    # Rule-based evaluation (simple fuzzy rules)
+    performance_score = (
+        att_high * 0.3 + test_high_m * 0.4 + ass_high * 0.3 +
+        att_med * 0.2 + test_med_m * 0.3 + ass_med * 0.2 +
+        att_low * 0.1 + test_low_m * 0.1 + ass_low * 0.1
+    ) * 100
+
+    # Final fuzzy result: branchless boundary lookup instead of an
+    # if/elif ladder (bisect_left keeps the boundaries exclusive)
+    category = _CATEGORIES[bisect_left(_CAT_BOUNDS, performance_score)]
+
+    return performance_score, category
+
+def compute_fuzzy_performance_batch(attendance, test, assignment):
+    # Vectorized version of compute_fuzzy_performance: each argument is a
+    # sequence of values and the whole cohort is scored in one pass
+    attendance = np.asarray(attendance, dtype=float)
+    test = np.asarray(test, dtype=float)
+    assignment = np.asarray(assignment, dtype=float)
+
+    att_low = np.interp(attendance, _X, _ATT_LOW)
+    att_med = np.interp(attendance, _X, _ATT_MED)
+    att_high = np.interp(attendance, _X, _ATT_HIGH)
+
+    test_low_m = np.interp(test, _X, _TEST_LOW)
+    test_med_m = np.interp(test, _X, _TEST_MED)
+    test_high_m = np.interp(test, _X, _TEST_HIGH)
+
+    ass_low = np.interp(assignment, _X, _ASS_LOW)
+    ass_med = np.interp(assignment, _X, _ASS_MED)
+    ass_high = np.interp(assignment, _X, _ASS_HIGH)
+
+    performance_score = (
+        att_high * 0.3 + test_high_m * 0.4 + ass_high * 0.3 +
+        att_med * 0.2 + test_med_m * 0.3 + ass_med * 0.2 +
+        att_low * 0.1 + test_low_m * 0.1 + ass_low * 0.1
+    ) * 100
+
+    # searchsorted with side='left' matches the scalar bisect_left lookup
+    indices = np.searchsorted(_CAT_BOUNDS, performance_score, side="left")
+    categories = [_CATEGORIES[i] for i in indices]
+
+    return performance_score.tolist(), categories
@@ -1,17 +1,32 @@
-from reportlab.pdfgen import canvas
+# Report filename template, kept as a module constant so batch report
+# runs reuse one format string
+_FILENAME_FMT = "%s_report.pdf"
+
+# Fixed page layout replayed for every report: (x, y, text template),
+# filled per student with name, score and category in that order
+_HEADER_LAYOUT = (
+    (50, 800, "Student Report: %s"),
+    (50, 760, "Total Score: %s"),
+    (50, 740, "Category: %s"),
+)
+_FEEDBACK_HEADER = (50, 700, "Feedback:")
 
 def generate_pdf(name, score, category, feedback):
-    filename = f"{name}_report.pdf"
+    # reportlab is only needed once a PDF is actually requested, so the
+    # import is deferred to keep app startup light (cached after the
+    # first call)
+    from reportlab.pdfgen import canvas
+
+    filename = _FILENAME_FMT % name
     c = canvas.Canvas(filename)
 
-    c.drawString(50, 800, f"Student Report: {name}")
-    c.drawString(50, 760, f"Total Score: {score}")
-    c.drawString(50, 740, f"Category: {category}")
-    c.drawString(50, 700, "Feedback:")
+    for (x, y, template), value in zip(_HEADER_LAYOUT, (name, score, category)):
+        c.drawString(x, y, template % value)
+    c.drawString(*_FEEDBACK_HEADER)
 
     y = 680
     for item in feedback:
-        c.drawString(60, y, f"- {item}")
+        c.drawString(60, y, "- %s" % item)
         y -= 20
 
     c.save()
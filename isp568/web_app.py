@@ -1,21 +1,40 @@
 import streamlit as st
-from modules.fuzzy_logic import compute_fuzzy_performance
-from modules.feedback import generate_feedback
+from modules.evaluation import evaluate_student
+from modules.fuzzy_logic import membership_curves
+
+# The membership functions never change at runtime, so build the chart
+# data once and let Streamlit reuse it across reruns
+@st.cache_data
+def load_membership_charts():
+    return {
+        name: {term: curve.tolist() for term, curve in curves.items()}
+        for name, curves in membership_curves().items()
+    }
+
+# Results depend only on the three slider values, so repeated
+# evaluations of the same inputs come straight from the cache
+@st.cache_data
+def cached_evaluate(attendance, test, assignment):
+    return evaluate_student(attendance, test, assignment)
 
 st.title("Student Performance Evaluation (Fuzzy Logic)")
 
+with st.expander("Membership Functions"):
+    for name, chart in load_membership_charts().items():
+        st.caption(name)
+        st.line_chart(chart)
+
 attendance = st.slider("Attendance (%)", 0, 100, 70)
 test = st.slider("Test Score", 0, 100, 60)
 assignment = st.slider("Assignment Score", 0, 100, 75)
 
 if st.button("Evaluate"):
-    score, category = compute_fuzzy_performance(attendance, test, assignment)
-    feedback = generate_feedback(attendance, test, assignment)
+    result = cached_evaluate(attendance, test, assignment)
 
     st.subheader("Results")
-    st.write("Fuzzy Score:", round(score, 2))
-    st.write("Category:", category)
+    st.write("Fuzzy Score:", round(result["score"], 2))
+    st.write("Category:", result["category"])
 
     st.subheader("Feedback")
-    for f in feedback:
+    for f in result["feedback"]:
         st.write("- " + f)